@@ -0,0 +1,80 @@
+"""
+Numeric counterpart of the Array2D ADT backed by a NumPy array,
+with Numba-compiled kernels that work on the underlying ndarray.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, the kernels then run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+class Array2DNumeric:
+    """A 2-D array of a fixed numeric dtype, akin to Array2D."""
+
+    def __init__(self, num_rows, num_cols, dtype=np.float64):
+        """Creates a num_rows x num_cols array of dtype filled with zeros."""
+        assert num_rows > 0 and num_cols > 0, "Array size must be > 0"
+        self._data = np.zeros((num_rows, num_cols), dtype=dtype)
+
+    def num_rows(self):
+        """Returns the number of rows in the 2-D array."""
+        return self._data.shape[0]
+
+    def num_cols(self):
+        """Returns the number of columns in the 2-D array."""
+        return self._data.shape[1]
+
+    def clear(self, value):
+        """Clears the array by setting every element to the given value."""
+        self._data.fill(value)
+
+    def __getitem__(self, index_tuple):
+        """Gets the contents of the element at position [i, j]."""
+        return self._data[index_tuple]
+
+    def __setitem__(self, index_tuple, value):
+        """Sets the contents of the element at position [i, j] to value."""
+        self._data[index_tuple] = value
+
+    def asarray(self):
+        """Returns the underlying ndarray, without copying."""
+        return self._data
+
+
+@njit(parallel=True, cache=True)
+def fill(a, v):
+    """Sets every element of the 2-D array a to v."""
+    for i in prange(a.shape[0]):
+        for j in range(a.shape[1]):
+            a[i, j] = v
+
+
+@njit(parallel=True, cache=True)
+def scale(a, k):
+    """Multiplies every element of the 2-D array a by k in place."""
+    for i in prange(a.shape[0]):
+        for j in range(a.shape[1]):
+            a[i, j] *= k
+
+
+def elementwise_add(a, b, out):
+    """Stores a + b in out; all three 2-D arrays must have the same shape.
+    Raises: ValueError if the shapes differ."""
+    if not a.shape == b.shape == out.shape:
+        raise ValueError("Arrays must have the same shape.")
+    _elementwise_add(a, b, out)
+
+
+@njit(parallel=True, cache=True)
+def _elementwise_add(a, b, out):
+    # Compiled without bounds checking, so the caller checks the shapes.
+    for i in prange(a.shape[0]):
+        for j in range(a.shape[1]):
+            out[i, j] = a[i, j] + b[i, j]
@@ -1,4 +1,7 @@
+import array
 import ctypes
+import operator
+from collections import deque
 
 
 # Implements the Array ADT using array capabilities of the ctypes module.
@@ -12,7 +15,7 @@ class Array:
         PyArrayType = ctypes.py_object * size
         self._elements = PyArrayType()
         # Initialize each element.
-        self.clear(None)
+        self._elements[:] = (None,) * size
 
     # Returns the size of the array.
     def __len__(self):
@@ -20,190 +23,154 @@ class Array:
 
     # Gets the contents of the index element.
     def __getitem__(self, index):
-        assert index >= 0 and index < len(self), "Array subscript out of range"
+        if not 0 <= index < self._size:
+            raise IndexError("Array subscript out of range")
         return self._elements[index]
 
     # Puts the value in the array element at index position.
     def __setitem__(self, index, value):
-        assert index >= 0 and index < len(self), "Array subscript out of range"
+        if not 0 <= index < self._size:
+            raise IndexError("Array subscript out of range")
         self._elements[index] = value
 
     # Clears the array by setting each element to the given value.
     def clear(self, value):
-        for i in range(len(self)):
-            self._elements[i] = value
+        self._elements[:] = (value,) * self._size
 
     # Returns the array's iterator for traversing the elements.
     def __iter__(self):
-        return _ArrayIterator(self._elements)
+        return iter(self._elements)
 
 
-# An iterator for the Array ADT.
-class _ArrayIterator:
-    def __init__(self, the_array):
-        self._array_ref = the_array
-        self._cur_index = 0
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self._cur_index < len(self._array_ref):
-            entry = self._array_ref[self._cur_index]
-            self._cur_index += 1
-            return entry
-        else:
-            raise StopIteration
-
-
-# Implementation of the Array2D ADT using an array of arrays.
+# Implementation of the Array2D ADT using a single row-major array.
 
 class Array2D:
     # Creates a 2 -D array of size numRows x numCols.
     def __init__(self, num_rows, num_cols):
-        # Create a 1 -D array to store an array reference for each row.
-        self.rows = Array(num_rows)
-
-        # Create the 1 -D arrays for each row of the 2 -D array.
-        for i in range(num_rows):
-            self.rows[i] = Array(num_cols)
+        assert num_rows > 0 and num_cols > 0, "Array size must be > 0"
+        self._nrows = num_rows
+        self._ncols = num_cols
+        # Create one 1 -D array holding the rows one after another.
+        PyArrayType = ctypes.py_object * (num_rows * num_cols)
+        self._data = PyArrayType()
+        self._data[:] = (None,) * (num_rows * num_cols)
 
     # Returns the number of rows in the 2 -D array.
     def num_rows(self):
-        return len(self.rows)
+        return self._nrows
 
     # Returns the number of columns in the 2 -D array.
     def num_cols(self):
-        return len(self.rows[0])
+        return self._ncols
 
     # Clears the array by setting every element to the given value.
     def clear(self, value):
-        for row in self.rows:
-            row.clear(value)
+        self._data[:] = (value,) * (self._nrows * self._ncols)
 
     # Gets the contents of the element at position [i, j]
     def __getitem__(self, index_tuple):
-        assert len(index_tuple) == 2, "Invalid number of array subscripts."
-        row = index_tuple[0]
-        col = index_tuple[1]
-        assert row >= 0 and row < self.num_rows() \
-               and col >= 0 and col < self.num_cols(), \
-            "Array subscript out of range."
-        array_1d = self.rows[row]
-        return array_1d[col]
+        row, col = index_tuple
+        if not (0 <= row < self._nrows and 0 <= col < self._ncols):
+            raise IndexError("Array subscript out of range.")
+        return self._data[row * self._ncols + col]
 
     # Sets the contents of the element at position [i,j] to value.
     def __setitem__(self, index_tuple, value):
-        assert len(index_tuple) == 2, "Invalid number of array subscripts."
-        row = index_tuple[0]
-        col = index_tuple[1]
-        assert row >= 0 and row < self.num_rows() \
-               and col >= 0 and col < self.num_cols(), \
-            "Array subscript out of range."
-        array_1d = self.rows[row]
-        array_1d[col] = value
+        row, col = index_tuple
+        if not (0 <= row < self._nrows and 0 <= col < self._ncols):
+            raise IndexError("Array subscript out of range.")
+        self._data[row * self._ncols + col] = value
 
 
 class DynamicArray:
     """A dynamic array class akin to a simplified Python list."""
 
-    def __init__(self):
-        """Create an empty array."""
-        self._n = 0  # count actual elements
-        self._capacity = 1  # default array capacity
-        self._A = self._make_array(self._capacity)  # low-level array
+    def __init__(self, sourceCollection=None):
+        """Create an array holding the items of sourceCollection,
+        or an empty array if it's not present."""
+        self._A = []  # list already grows with amortized doubling
+        if sourceCollection is not None:
+            self.extend(sourceCollection)
 
     def __len__(self):
         """Return number of elements stored in the array."""
-        return self._n
+        return len(self._A)
 
     def __getitem__(self, k):
         """Return element at index k."""
-        if not 0 <= k < self._n:
+        if not 0 <= k < len(self._A):
             raise IndexError('invalid index')
         return self._A[k]  # retrieve from array
 
     def append(self, obj):
         """Add object to end of the array."""
-        if self._n == self._capacity:  # not enough room
-            self._resize(2 * self._capacity)  # so double capacity
-        self._A[self._n] = obj
-        self._n += 1
-
-    def _resize(self, c):  # nonpublic utitity
-        """Resize internal array to capacity c."""
-        B = self._make_array(c)  # new (bigger) array
-        for k in range(self._n):  # for each existing value
-            B[k] = self._A[k]
-        self._A = B  # use the bigger array
-        self._capacity = c
-
-    def _make_array(self, c):  # nonpublic utitity
-        """Return new array with capacity c."""
-        return (c * ctypes.py_object)()  # see ctypes documentation
+        self._A.append(obj)
+
+    def extend(self, iterable):
+        """Add every object of iterable to end of the array."""
+        self._A.extend(iterable)  # sized inputs are grown in a single step
 
     def insert(self, k, value):
         """Insert value at index k, shifting subsequent values rightward."""
         # (for simplicity, we assume 0 <= k <= n in this verion)
-        if self._n == self._capacity:  # not enough room
-            self._resize(2 * self._capacity)  # so double capacity
-        for j in range(self._n, k, -1):  # shift rightmost first
-            self._A[j] = self._A[j - 1]
-        self._A[k] = value  # store newest element
-        self._n += 1
+        self._A.insert(k, value)
 
     def remove(self, value):
         """Remove first occurrence of value( or  raise ValueError)."""
-        # note: we do not consider shrinking the dynamic array in this version
-        for k in range(self._n):
-            if self._A[k] == value:  # found a match!
-                for j in range(k, self._n - 1):  # shift others to fill gap
-                    self._A[j] = self._A[j + 1]
-                self._A[self._n - 1] = None  # help garbage collection
-                self._n -= 1  # we have one less item
+        try:
+            self._A.remove(value)
+        except ValueError:
+            raise ValueError("value not found") from None
+
 
-                return  # exit immediately
-        raise ValueError("value not found")  # only reached if no match
+class NumericDynamicArray(DynamicArray):
+    """A dynamic array of unboxed numbers stored in an array.array."""
+
+    def __init__(self, sourceCollection=None, typecode='d'):
+        """Create an array of the given array module typecode holding the
+        items of sourceCollection, or an empty one if it's not present."""
+        self._A = array.array(typecode)
+        if sourceCollection is not None:
+            self.extend(sourceCollection)
+
+    @property
+    def typecode(self):
+        """Return the array module typecode of the stored items."""
+        return self._A.typecode
+
+    def to_numpy(self):
+        """Return a NumPy view sharing memory with the array.
+        The array cannot grow or shrink while the view is alive."""
+        import numpy as np
+        return np.frombuffer(self._A, dtype=self._A.typecode)
 
 
 class Stack:
     # Creates an empty stack.
     def __init__(self):
-        self._top = None
-        self._size = 0
+        self._items = []
 
     # Returns True if the stack is empty or False otherwise.
     def is_empty(self):
-        return self._top is None
+        return not self._items
 
     # Returns the number of items in the stack.
     def __len__(self):
-        return self._size
+        return len(self._items)
 
     # Returns the top item on the stack without removing it.
     def peek(self):
-        assert not self.is_empty(), "Cannot peek at an empty stack"
-        return self._top.item
+        assert self._items, "Cannot peek at an empty stack"
+        return self._items[-1]
 
     # Removes and returns the top item on the stack.
     def pop(self):
-        assert not self.is_empty(), "Cannot pop from an empty stack"
-        node = self._top
-        self._top = self._top.next
-        self._size -= 1
-        return node.item
+        assert self._items, "Cannot pop from an empty stack"
+        return self._items.pop()
 
     # Pushes an item onto the top of the stack.
     def push(self, item):
-        self._top = _StackNode(item, self._top)
-        self._size += 1
-
-
-# The private storage class for creating stack nodes.
-class _StackNode:
-    def __init__(self, item, link):
-        self.item = item
-        self.next = link
+        self._items.append(item)
 
 
 class AbstractCollection:
@@ -215,8 +182,7 @@ class AbstractCollection:
         contents of sourceCollection, if it's present."""
         self._size = 0
         if sourceCollection:
-            for item in sourceCollection:
-                self.add(item)
+            self._bulk_add(sourceCollection)
 
     def add(self, item):
         raise NotImplementedError
@@ -238,28 +204,28 @@ class AbstractCollection:
 
     def __str__(self):
         """Returns the string representation of self."""
-        return "[" + ", ".join(map(str, self)) + "]"
+        return "[" + ", ".join([str(item) for item in self]) + "]"
 
     def __add__(self, other):
         """Returns a new bag containing the contents
         of self and other."""
         result = type(self)(self)
-        for item in other:
-            result.add(item)
+        result._bulk_add(other)
         return result
 
+    def _bulk_add(self, iterable):
+        """Adds every item of iterable to self."""
+        for item in iterable:
+            self.add(item)
+
     def __eq__(self, other):
         """Returns True if self equals other,
         or False otherwise."""
         if self is other: return True
-        if type(self) != type(other) or \
+        if type(self) is not type(other) or \
                 len(self) != len(other):
             return False
-        otherIter = iter(other)
-        for item in self:
-            if item != next(otherIter):
-                return False
-        return True
+        return all(map(operator.eq, self, other))
 
 
 class AbstractStack(AbstractCollection):
@@ -280,55 +246,55 @@ class AbstractStack(AbstractCollection):
 class Node:
     """Represents a singly linked node."""
 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data, next=None):
         self.data = data
         self.next = next
 
 
 class LinkedStack(AbstractStack):
-    """A link-based stack implementation."""
+    """A stack implementation backed by a Python list.
+    The top of the stack is the end of the list."""
 
     # Constructor
     def __init__(self, sourceCollection=None):
         """Sets the initial state of self, which includes the
         contents of sourceCollection, if it's present."""
-        self._items = None
+        self._items = []
         AbstractStack.__init__(self, sourceCollection)
 
     # Accessor methods
+    def __len__(self):
+        """Returns the number of items in self."""
+        return len(self._items)
+
     def __iter__(self):
         """Supports iteration over a view of self.
         Visits items from bottom to top of stack."""
-
-        def visitNodes(node):
-            """Adds items to tempList from tail to head."""
-            if not node is None:
-                visitNodes(node.next)
-                tempList.append(node.data)
-
-        tempList = list()
-        visitNodes(self._items)
-        return iter(tempList)
+        return iter(self._items)
 
     def peek(self):
         """
         Returns the item at the top of the stack.
         Precondition: the stack is not empty.
         Raises: KeyError if the stack is empty."""
-        if self.isEmpty():
+        if not self._items:
             raise KeyError("The stack is empty.")
-        return self._items.data
+        return self._items[-1]
 
     # Mutator methods
     def clear(self):
         """Makes self become empty."""
-        self._size = 0
-        self._items = None
+        self._items.clear()
 
     def push(self, item):
         """Adds item to the top of the stack."""
-        self._items = Node(item, self._items)
-        self._size += 1
+        self._items.append(item)
+
+    def _bulk_add(self, iterable):
+        """Pushes every item of iterable onto the stack."""
+        self._items.extend(iterable)
 
     def pop(self):
         """
@@ -336,56 +302,51 @@ class LinkedStack(AbstractStack):
         Precondition: the stack is not empty.
         Raises: KeyError if the stack is empty.
         Post condition: the top item is removed from the stack."""
-        if self.isEmpty():
+        if not self._items:
             raise KeyError("The stack is empty.")
-        oldItem = self._items.data
-        self._items = self._items.next
-        self._size -= 1
-        return oldItem
+        return self._items.pop()
 
 
 class LinkedQueue(AbstractCollection):
-    """A link-based queue implementation."""
+    """A queue implementation backed by collections.deque."""
 
     # Constructor
     def __init__(self, sourceCollection=None):
         """Sets the initial state of self, which includes the
         contents of sourceCollection, if it's present."""
-        self._front = self._rear = None
+        self._q = deque()
         AbstractCollection.__init__(self, sourceCollection)
 
     # Accessor methods
+    def __len__(self):
+        """Returns the number of items in self."""
+        return len(self._q)
+
     def __iter__(self):
         """Supports iteration over a view of self."""
-        cursor = self._front
-        while not cursor is None:
-            yield cursor.data
-            cursor = cursor.next
+        return iter(self._q)
 
     def peek(self):
         """
         Returns the item at the front of the queue.
         Precondition: the queue is not empty.
         Raises: KeyError if the stack is empty."""
-        if self.isEmpty():
+        if not self._q:
             raise KeyError("The queue is empty.")
-        return self._front.data
+        return self._q[0]
 
     # Mutator methods
     def clear(self):
         """Makes self become empty."""
-        self._size = 0
-        self._front = self._rear = None
+        self._q.clear()
 
     def add(self, item):
         """Adds item to the rear of the queue."""
-        newNode = Node(item, None)
-        if self.isEmpty():
-            self._front = newNode
-        else:
-            self._rear.next = newNode
-        self._rear = newNode
-        self._size += 1
+        self._q.append(item)
+
+    def _bulk_add(self, iterable):
+        """Adds every item of iterable to the rear of the queue."""
+        self._q.extend(iterable)
 
     def pop(self):
         """
@@ -393,14 +354,9 @@ class LinkedQueue(AbstractCollection):
         Precondition: the queue is not empty.
         Raises: KeyError if the queue is empty.
         Post condition: the front item is removed from the queue."""
-        if self.isEmpty():
+        if not self._q:
             raise KeyError("The queue is empty.")
-        oldItem = self._front.data
-        self._front = self._front.next
-        if self._front is None:
-            self._rear = None
-        self._size -= 1
-        return oldItem
+        return self._q.popleft()
 
     def remove(self, index):
         """Removes and returns the item at index,
@@ -408,25 +364,38 @@ class LinkedQueue(AbstractCollection):
         Precondition: 0 <= index < size of queue"""
         if index < 0 or index >= len(self):
             raise AttributeError("i must be >= 0 and < size of queue")
-        if index == 0:
-            oldItem = self._front.data
-            self._front = self._front.next
-        else:
-            probe = self._front
-            while index > 1:
-                probe = probe.next
-                index -= 1
-            oldItem = probe.next.data
-            probe.next = probe.next.next
-        self._size -= 1
-        if self.isEmpty():
-            self._rear = None
+        oldItem = self._q[index]
+        del self._q[index]
         return oldItem
 
 class BSTNode:
     """Represents a node for a linked binary search tree."""
 
+    __slots__ = ('data', 'left', 'right')
+
     def __init__(self, data, left = None, right = None):
         self.data = data
         self.left = left
-        self.right = right
\ No newline at end of file
+        self.right = right
+
+
+class BSTArrayStore:
+    """Stores the nodes of a binary search tree in parallel arrays.
+    A node is an integer index into data, left and right; a missing
+    child is -1."""
+
+    def __init__(self):
+        self.data = []
+        self.left = array.array('i')
+        self.right = array.array('i')
+
+    def __len__(self):
+        """Returns the number of nodes in the store."""
+        return len(self.data)
+
+    def new_node(self, data):
+        """Adds a childless node holding data and returns its index."""
+        self.data.append(data)
+        self.left.append(-1)
+        self.right.append(-1)
+        return len(self.data) - 1